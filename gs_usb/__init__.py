@@ -1,4 +1,4 @@
 from .__version__ import __version__
 from .gs_usb import GsUsb
-from .gs_usb_frame import GsUsbFrame
+from .gs_usb_frame import FramePool, GsUsbFrame
 from .gs_usb_structures import DeviceCapability, DeviceInfo
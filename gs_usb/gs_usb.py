@@ -1,5 +1,7 @@
 from struct import *
+import array
 import platform
+import time
 
 from usb.backend import libusb1
 import usb.core
@@ -22,6 +24,9 @@ GS_USB_CES_CANEXT_FD_PRODUCT_ID = 0x606F
 GS_USB_ABE_CANDEBUGGER_FD_VENDOR_ID = 0x16D0
 GS_USB_ABE_CANDEBUGGER_FD_PRODUCT_ID = 0x10B8
 
+# Kernel driver has to be detached before performing IO on Linux/Unix system
+_IS_POSIX = "windows" not in platform.system().lower()
+
 #gs_usb mode
 GS_CAN_MODE_RESET = 0
 GS_CAN_MODE_START = 1
@@ -34,12 +39,63 @@ _GS_USB_BREQ_BERR = 3
 _GS_USB_BREQ_BT_CONST = 4
 _GS_USB_BREQ_DEVICE_CONFIG = 5
 
+# Stopping always sends the same mode payload
+_RESET_MODE_PAYLOAD = DeviceMode(GS_CAN_MODE_RESET, 0).pack()
+
+# Enumerated pyusb devices are shared by scan() results for this long, in seconds
+_SCAN_CACHE_TTL = 1.0
+
+_backend = None
+_scan_cache = (0.0, None)
+
+
+def _get_backend():
+    global _backend
+    if _backend is None:
+        _backend = libusb1.get_backend()
+    return _backend
+
+
+# Bit timings (phase_seg1, phase_seg2, brp) with sample point 87.5% per device clock and bitrate
+_BIT_TIMINGS_87_5 = {
+    48000000: {
+        10000: (12, 2, 300),
+        20000: (12, 2, 150),
+        50000: (12, 2, 60),
+        83333: (12, 2, 36),
+        100000: (12, 2, 30),
+        125000: (12, 2, 24),
+        250000: (12, 2, 12),
+        500000: (12, 2, 6),
+        800000: (11, 2, 4),
+        1000000: (12, 2, 3),
+    },
+    80000000: {
+        10000: (12, 2, 500),
+        20000: (12, 2, 250),
+        50000: (12, 2, 100),
+        83333: (12, 2, 60),
+        100000: (12, 2, 50),
+        125000: (12, 2, 40),
+        250000: (12, 2, 20),
+        500000: (12, 2, 10),
+        800000: (7, 1, 10),
+        1000000: (12, 2, 5),
+    },
+}
+
 
 class GsUsb:
     def __init__(self, gs_usb):
         self.gs_usb = gs_usb
         self.capability = None
         self.device_flags = None
+        self._tx_buf = bytearray(GS_USB_FRAME_SIZE_HW_TIMESTAMP)
+        self._rx_scratch = array.array("B", bytes(GS_USB_FRAME_SIZE_HW_TIMESTAMP))
+
+        # Bind bulk transfer methods once for the send/read hot path
+        self._usb_write = gs_usb.write
+        self._usb_read = gs_usb.read
 
     def start(self, flags=(GS_CAN_MODE_NORMAL | GS_CAN_MODE_HW_TIMESTAMP)):
         r"""
@@ -50,9 +106,7 @@ class GsUsb:
         self.gs_usb.reset()
 
         # Detach usb from kernel driver in Linux/Unix system to perform IO
-        if "windows" not in platform.system().lower() and self.gs_usb.is_kernel_driver_active(
-            0
-        ):
+        if _IS_POSIX and self.gs_usb.is_kernel_driver_active(0):
             self.gs_usb.detach_kernel_driver(0)
 
         #Only allow features that the device supports
@@ -69,9 +123,8 @@ class GsUsb:
         r"""
         Stop gs_usb device
         """
-        mode = DeviceMode(GS_CAN_MODE_RESET, 0)
         try:
-            self.gs_usb.ctrl_transfer(0x41, _GS_USB_BREQ_MODE, 0, 0, mode.pack())
+            self.gs_usb.ctrl_transfer(0x41, _GS_USB_BREQ_MODE, 0, 0, _RESET_MODE_PAYLOAD)
         except usb.core.USBError:
             pass
 
@@ -86,58 +139,23 @@ class GsUsb:
         prop_seg = 1
         sjw = 1
 
-        if ((self.device_capability.fclk_can == 48000000) and (sample_point == 87.5)):
-            if bitrate == 10000:
-                self.set_timing(prop_seg, 12, 2, sjw, 300)
-            elif bitrate == 20000:
-                self.set_timing(prop_seg, 12, 2, sjw, 150)
-            elif bitrate == 50000:
-                self.set_timing(prop_seg, 12, 2, sjw, 60)
-            elif bitrate == 83333:
-                self.set_timing(prop_seg, 12, 2, sjw, 36)
-            elif bitrate == 100000:
-                self.set_timing(prop_seg, 12, 2, sjw, 30)
-            elif bitrate == 125000:
-                self.set_timing(prop_seg, 12, 2, sjw, 24)
-            elif bitrate == 250000:
-                self.set_timing(prop_seg, 12, 2, sjw, 12)
-            elif bitrate == 500000:
-                self.set_timing(prop_seg, 12, 2, sjw, 6)
-            elif bitrate == 800000:
-                self.set_timing(prop_seg, 11, 2, sjw, 4)
-            elif bitrate == 1000000:
-                self.set_timing(prop_seg, 12, 2, sjw, 3)
-            else:
-                return False
-            return True
-        elif ((self.device_capability.fclk_can == 80000000) and (sample_point == 87.5)):
-            if bitrate == 10000:
-                self.set_timing(prop_seg, 12, 2, sjw, 500)
-            elif bitrate == 20000:
-                self.set_timing(prop_seg, 12, 2, sjw, 250)
-            elif bitrate == 50000:
-                self.set_timing(prop_seg, 12, 2, sjw, 100)
-            elif bitrate == 83333:
-                self.set_timing(prop_seg, 12, 2, sjw, 60)
-            elif bitrate == 100000:
-                self.set_timing(prop_seg, 12, 2, sjw, 50)
-            elif bitrate == 125000:
-                self.set_timing(prop_seg, 12, 2, sjw, 40)
-            elif bitrate == 250000:
-                self.set_timing(prop_seg, 12, 2, sjw, 20)
-            elif bitrate == 500000:
-              self.set_timing(prop_seg, 12, 2, sjw, 10)
-            elif bitrate == 800000:
-                self.set_timing(prop_seg, 7, 1, sjw, 10)
-            elif bitrate == 1000000:
-                self.set_timing(prop_seg, 12, 2, sjw, 5)
-            else:
-                return False
-            return True
-        else:
-            #device clk or sample point currently unsupported
+        if sample_point != 87.5:
+            #sample point currently unsupported
             return False
 
+        timings = _BIT_TIMINGS_87_5.get(self.device_capability.fclk_can)
+        if timings is None:
+            #device clk currently unsupported
+            return False
+
+        timing = timings.get(bitrate)
+        if timing is None:
+            return False
+
+        phase_seg1, phase_seg2, brp = timing
+        self.set_timing(prop_seg, phase_seg1, phase_seg2, sjw, brp)
+        return True
+
     def set_timing(self, prop_seg, phase_seg1, phase_seg2, sjw, brp):
         r"""
         Set CAN bit timing
@@ -157,9 +175,40 @@ class GsUsb:
         """
         #Frame size is different depending on HW timestamp feature support
         hw_timestamps = ((self.device_flags & GS_CAN_MODE_HW_TIMESTAMP) == GS_CAN_MODE_HW_TIMESTAMP)
-        self.gs_usb.write(0x02, frame.pack(hw_timestamps))
+        frame.pack_into(self._tx_buf, 0, hw_timestamps)
+        if hw_timestamps:
+            self._usb_write(0x02, self._tx_buf)
+        else:
+            self._usb_write(0x02, memoryview(self._tx_buf)[:GS_USB_FRAME_SIZE])
         return True
 
+    def send_many(self, frames):
+        r"""
+        Send frames
+        Each frame goes out in its own bulk transfer since the device expects one frame per transfer.
+        :param frames: list of GsUsbFrame
+        :return: number of frames sent
+        :raises usb.core.USBError: as send() does, with the number of frames sent before the
+                                   failure stored in its frames_sent attribute
+        """
+        #Frame size is different depending on HW timestamp feature support
+        hw_timestamps = ((self.device_flags & GS_CAN_MODE_HW_TIMESTAMP) == GS_CAN_MODE_HW_TIMESTAMP)
+        if hw_timestamps:
+            data = self._tx_buf
+        else:
+            data = memoryview(self._tx_buf)[:GS_USB_FRAME_SIZE]
+
+        count = 0
+        for frame in frames:
+            frame.pack_into(self._tx_buf, 0, hw_timestamps)
+            try:
+                self._usb_write(0x02, data)
+            except usb.core.USBError as e:
+                e.frames_sent = count
+                raise
+            count += 1
+        return count
+
     def read(self, frame, timeout_ms):
         r"""
         Read frame
@@ -170,12 +219,15 @@ class GsUsb:
         """
         #Frame size is different depending on HW timestamp feature support
         hw_timestamps = ((self.device_flags & GS_CAN_MODE_HW_TIMESTAMP) == GS_CAN_MODE_HW_TIMESTAMP)
+        frame_size = GS_USB_FRAME_SIZE_HW_TIMESTAMP if hw_timestamps else GS_USB_FRAME_SIZE
         try:
-            data = self.gs_usb.read(0x81, frame.__sizeof__(hw_timestamps), timeout_ms)
+            n = self._usb_read(0x81, self._rx_scratch, timeout_ms)
         except usb.core.USBError:
             return False
+        if n < frame_size:
+            return False
 
-        GsUsbFrame.unpack_into(frame, data, hw_timestamps)
+        GsUsbFrame.unpack_into(frame, self._rx_scratch, hw_timestamps)
         return True
 
     @property
@@ -227,16 +279,24 @@ class GsUsb:
     def scan(cls):
         r"""
         Retrieve the list of gs_usb devices handle
+        The enumeration is cached for one second. Within that time scan() returns new GsUsb
+        objects wrapping the same pyusb devices, which share the libusb handle, interface
+        claims and kernel driver state. Use only one handle per device at a time.
         :return: list of gs_usb devices handle
         """
-        return [
-            GsUsb(dev)
-            for dev in usb.core.find(
-                find_all=True,
-                custom_match = cls.is_gs_usb_device,
-                backend=libusb1.get_backend(),
+        global _scan_cache
+        timestamp, devs = _scan_cache
+        now = time.monotonic()
+        if devs is None or now - timestamp >= _SCAN_CACHE_TTL:
+            devs = list(
+                usb.core.find(
+                    find_all=True,
+                    custom_match = cls.is_gs_usb_device,
+                    backend=_get_backend(),
+                )
             )
-        ]
+            _scan_cache = (now, devs)
+        return [GsUsb(dev) for dev in devs]
 
     @classmethod
     def find(cls, bus, address):
@@ -248,7 +308,7 @@ class GsUsb:
             custom_match = cls.is_gs_usb_device,
             bus=bus,
             address=address,
-            backend=libusb1.get_backend(),
+            backend=_get_backend(),
         )
         if gs_usb:
             return GsUsb(gs_usb)
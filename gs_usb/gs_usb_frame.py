@@ -1,4 +1,4 @@
-from .constants import CAN_EFF_FLAG, CAN_RTR_FLAG, CAN_ERR_FLAG, CAN_EFF_MASK
+from .constants import CAN_EFF_FLAG, CAN_RTR_FLAG, CAN_ERR_FLAG, CAN_EFF_MASK, CAN_MAX_DLEN
 from struct import *
 
 # gs_usb general
@@ -8,8 +8,21 @@ GS_USB_NONE_ECHO_ID = 0xFFFFFFFF
 GS_USB_FRAME_SIZE = 20
 GS_USB_FRAME_SIZE_HW_TIMESTAMP = 24
 
+# Precompiled frame layouts, shared by every frame to avoid reparsing the format
+_FRAME_HEADER_STRUCT = Struct("<2I4B")
+_FRAME_DATA_STRUCT = Struct("8s")
+_FRAME_TIMESTAMP_STRUCT = Struct("<I")
+
+# Upper case hex representation of every byte value, used by GsUsbFrame.__str__
+_HEX_BYTES = tuple("{:02X}".format(b) for b in range(256))
+
 class GsUsbFrame:
-    def __init__(self, can_id=0, data=[]):
+    __slots__ = (
+        "echo_id", "can_id", "can_dlc", "channel",
+        "flags", "reserved", "data", "timestamp_us",
+    )
+
+    def __init__(self, can_id=0, data=b""):
         self.echo_id = GS_USB_ECHO_ID
         self.can_id = can_id
         self.channel = 0
@@ -17,10 +30,11 @@ class GsUsbFrame:
         self.reserved = 0
         self.timestamp_us = 0
 
-        if type(data) == bytes:
-            data = list(data)
+        if len(data) > CAN_MAX_DLEN:
+            raise ValueError("data must be at most {} bytes".format(CAN_MAX_DLEN))
 
-        self.data = data + [0] * (8 - len(data))
+        self.data = bytearray(8)
+        self.data[:len(data)] = data
         self.can_dlc = len(data)
 
     @property
@@ -43,41 +57,64 @@ class GsUsbFrame:
     def timestamp(self):
         return self.timestamp_us / 1000000.0
 
-    def __sizeof__(self, hw_timestamp):
-        if (hw_timestamp == True):
-            return GS_USB_FRAME_SIZE_HW_TIMESTAMP
-        else:
-            return GS_USB_FRAME_SIZE
-
     def __str__(self) -> str:
         data = (
             "remote request"
             if self.is_remote_frame
-            else " ".join("{:02X}".format(b) for b in self.data[:self.can_dlc])
+            else " ".join(map(_HEX_BYTES.__getitem__, self.data[:self.can_dlc]))
         )
         return "{: >8X}   [{}]  {}".format(self.arbitration_id, self.can_dlc, data)
 
     def pack(self, hw_timestamp):
+        buf = bytearray(GS_USB_FRAME_SIZE_HW_TIMESTAMP if hw_timestamp else GS_USB_FRAME_SIZE)
+        self.pack_into(buf, 0, hw_timestamp)
+        return bytes(buf)
+
+    def pack_into(self, buf, offset, hw_timestamp):
+        _FRAME_HEADER_STRUCT.pack_into(buf, offset,
+            self.echo_id, self.can_id, self.can_dlc, self.channel,
+            self.flags, self.reserved,
+        )
+        # Fixed size field pads or truncates the payload to 8 bytes so buf never changes length
+        _FRAME_DATA_STRUCT.pack_into(buf, offset + 12, bytes(self.data))
         if (hw_timestamp == True):
-            return pack("<2I12BI",
-                self.echo_id, self.can_id, self.can_dlc, self.channel,
-                self.flags, self.reserved, *self.data, self.timestamp_us
-            )
-        else:
-            return pack("<2I12B",
-                self.echo_id, self.can_id, self.can_dlc, self.channel,
-                self.flags, self.reserved, *self.data,
-            )
+            _FRAME_TIMESTAMP_STRUCT.pack_into(buf, offset + 20, self.timestamp_us)
 
     @staticmethod
     def unpack_into(frame, data: bytes, hw_timestamp):
-        if (hw_timestamp == True):
-            (
-                frame.echo_id, frame.can_id, frame.can_dlc, frame.channel,
-                frame.flags, frame.reserved, *frame.data, frame.timestamp_us,
-            ) = unpack("<2I12BI", data)
+        (
+            frame.echo_id, frame.can_id, frame.can_dlc, frame.channel,
+            frame.flags, frame.reserved,
+        ) = _FRAME_HEADER_STRUCT.unpack_from(data)
+        # Reuse the payload buffer unless the caller replaced it with an immutable object
+        if type(frame.data) is bytearray:
+            frame.data[:] = data[12:20]
         else:
-            (
-                frame.echo_id, frame.can_id, frame.can_dlc, frame.channel,
-                frame.flags, frame.reserved, *frame.data,
-            ) = unpack("<2I12B", data)
+            frame.data = bytearray(data[12:20])
+        if (hw_timestamp == True):
+            (frame.timestamp_us,) = _FRAME_TIMESTAMP_STRUCT.unpack_from(data, 20)
+
+
+class FramePool:
+    r"""
+    Pool of reusable GsUsbFrame to avoid allocating a frame for every read
+    """
+    __slots__ = ("_free",)
+
+    def __init__(self, size=1024):
+        self._free = [GsUsbFrame() for _ in range(size)]
+
+    def __len__(self):
+        return len(self._free)
+
+    def acquire(self):
+        r"""
+        Take a frame from the pool, a new frame is created if the pool is empty
+        """
+        return self._free.pop() if self._free else GsUsbFrame()
+
+    def release(self, frame):
+        r"""
+        Return a frame to the pool once it is no longer used
+        """
+        self._free.append(frame)
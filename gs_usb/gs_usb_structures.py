@@ -1,5 +1,12 @@
 from struct import *
 
+# Precompiled layouts of the control transfer payloads
+_DEVICE_MODE_STRUCT = Struct("<II")
+_DEVICE_BIT_TIMING_STRUCT = Struct("<5I")
+_DEVICE_INFO_STRUCT = Struct("<4B2I")
+_DEVICE_CAPABILITY_STRUCT = Struct("<10I")
+
+
 class DeviceMode:
     def __init__(self, mode, flags):
         self.mode = mode
@@ -11,7 +18,7 @@ class DeviceMode:
             %(self.mode, self.flags)
 
     def pack(self):
-        return pack("<II", self.mode, self.flags)
+        return _DEVICE_MODE_STRUCT.pack(self.mode, self.flags)
 
 
 class DeviceBitTiming:
@@ -31,7 +38,7 @@ class DeviceBitTiming:
             %(self.prop_seg, self.phase_seg1, self.phase_seg2, self.sjw, self.brp)
 
     def pack(self):
-        return pack("<5I", self.prop_seg, self.phase_seg1, self.phase_seg2, self.sjw, self.brp)
+        return _DEVICE_BIT_TIMING_STRUCT.pack(self.prop_seg, self.phase_seg1, self.phase_seg2, self.sjw, self.brp)
 
 
 class DeviceInfo:
@@ -51,7 +58,7 @@ class DeviceInfo:
 
     @staticmethod
     def unpack(data: bytes):
-        unpacked_data = unpack("<4B2I", data)
+        unpacked_data = _DEVICE_INFO_STRUCT.unpack(data)
         return DeviceInfo(*unpacked_data)
 
 
@@ -80,5 +87,5 @@ class DeviceCapability:
 
     @staticmethod
     def unpack(data: bytes):
-        unpacked_data = unpack("<10I", data)
+        unpacked_data = _DEVICE_CAPABILITY_STRUCT.unpack(data)
         return DeviceCapability(*unpacked_data)
\ No newline at end of file